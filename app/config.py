@@ -1,19 +1,58 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
-from dotenv import load_dotenv
-from typing import Optional, Set, Dict, Any, List
+from dataclasses import dataclass
+from typing import Optional, Set, Dict, Any, List, Tuple
 import os
 from enum import Enum
-import secrets
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
-# Load environment variables
-load_dotenv()
+# In production the environment is provided by the deployment; only parse
+# the dotenv file (a filesystem stat + parse per process start) in development
+_IS_PRODUCTION = os.environ.get("ENVIRONMENT", "development") == "production"
+if not _IS_PRODUCTION:
+    # Imported lazily so production (and test collection) never pays for it
+    from dotenv import load_dotenv
+    load_dotenv()
 
 class Environment(str, Enum):
     DEVELOPMENT = "development"
     PRODUCTION = "production"
 
+# Precomputed value -> member map so validation is a single hash lookup
+# instead of a linear scan over the enum members
+_ENV_MAP = {e.value: e for e in Environment}
+
+# Environment-specific overrides are constants; a frozen slotted dataclass
+# makes reads a C-level slot access instead of a dict hash lookup
+@dataclass(slots=True, frozen=True)
+class EnvSettings:
+    DEBUG: bool
+    LOG_LEVEL: str
+    MONGODB_MAX_POOL_SIZE: int
+    RATE_LIMIT_PER_MINUTE: int
+    BACKEND_CORS_ORIGINS: Tuple[str, ...]
+    COOKIE_SECURE: bool
+    COOKIE_SAMESITE: str
+
+_DEV_SETTINGS = EnvSettings(
+    DEBUG=True,
+    LOG_LEVEL="debug",
+    MONGODB_MAX_POOL_SIZE=50,
+    RATE_LIMIT_PER_MINUTE=100,
+    BACKEND_CORS_ORIGINS=("*",),
+    COOKIE_SECURE=False,
+    COOKIE_SAMESITE="lax"
+)
+_PROD_SETTINGS = EnvSettings(
+    DEBUG=False,
+    LOG_LEVEL="info",
+    MONGODB_MAX_POOL_SIZE=100,
+    RATE_LIMIT_PER_MINUTE=60,
+    BACKEND_CORS_ORIGINS=(),  # Should be configured in production env file
+    COOKIE_SECURE=True,
+    COOKIE_SAMESITE="strict"
+)
+
 class Settings(BaseSettings):
     # Environment
     ENVIRONMENT: Environment = Field(
@@ -41,8 +80,11 @@ class Settings(BaseSettings):
     MONGODB_MIN_POOL_SIZE: int = Field(default=10, env="MONGODB_MIN_POOL_SIZE")
     
     # Security Settings
-    SECRET_KEY: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
+    SECRET_KEY: str = Field(default_factory=lambda: __import__("secrets").token_urlsafe(32))
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+    BCRYPT_COST: int = Field(default=12, env="BCRYPT_COST")
+    # Key for the BLAKE2b password pre-hash; falls back to SECRET_KEY when unset
+    PEPPER: str = Field(default="", env="PEPPER")
     
     # Cookie Settings
     COOKIE_SECURE: bool = Field(default=True, env="COOKIE_SECURE")
@@ -61,11 +103,31 @@ class Settings(BaseSettings):
     @classmethod
     def validate_environment(cls, v: str) -> Environment:
         """Validate environment value"""
-        try:
-            return Environment(v.lower())
-        except ValueError:
-            raise ValueError(f"Invalid environment: {v}. Must be one of {[e.value for e in Environment]}")
+        env = _ENV_MAP.get(v.lower() if isinstance(v, str) else v)
+        if env is None:
+            raise ValueError(f"Invalid environment: {v}. Must be one of {list(_ENV_MAP)}")
+        return env
     
+    @cached_property
+    def cookie_kwargs(self) -> Dict[str, Any]:
+        """Access token cookie parameters, derived once per process"""
+        return {
+            "httponly": True,
+            "secure": self.COOKIE_SECURE,
+            "samesite": self.COOKIE_SAMESITE,
+            "max_age": self.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        }
+
+    @cached_property
+    def logout_cookie_kwargs(self) -> Dict[str, Any]:
+        """Cookie-clearing parameters for logout, derived once per process"""
+        return {
+            "key": "access_token",
+            "httponly": True,
+            "secure": self.COOKIE_SECURE,
+            "samesite": self.COOKIE_SAMESITE
+        }
+
     @property
     def is_development(self) -> bool:
         return self.ENVIRONMENT == Environment.DEVELOPMENT
@@ -74,36 +136,22 @@ class Settings(BaseSettings):
     def is_production(self) -> bool:
         return self.ENVIRONMENT == Environment.PRODUCTION
     
-    def get_environment_specific_settings(self) -> Dict[str, Any]:
+    def get_environment_specific_settings(self) -> EnvSettings:
         """Get environment-specific settings"""
-        if self.is_development:
-            return {
-                "DEBUG": True,
-                "LOG_LEVEL": "debug",
-                "MONGODB_MAX_POOL_SIZE": 50,
-                "RATE_LIMIT_PER_MINUTE": 100,
-                "BACKEND_CORS_ORIGINS": ["*"],
-                "COOKIE_SECURE": False,
-                "COOKIE_SAMESITE": "lax"
-            }
-        return {
-            "DEBUG": False,
-            "LOG_LEVEL": "info",
-            "MONGODB_MAX_POOL_SIZE": 100,
-            "RATE_LIMIT_PER_MINUTE": 60,
-            "BACKEND_CORS_ORIGINS": [],  # Should be configured in production env file
-            "COOKIE_SECURE": True,
-            "COOKIE_SAMESITE": "strict"
-        }
+        return _DEV_SETTINGS if self.ENVIRONMENT is Environment.DEVELOPMENT else _PROD_SETTINGS
     
     model_config = {
-        "env_file": "env/development.env",
+        "env_file": None if _IS_PRODUCTION else "env/development.env",
         "env_file_encoding": "utf-8",
         "case_sensitive": True
     }
 
 @lru_cache()
 def get_settings() -> Settings:
-    return Settings()
+    settings = Settings()
+    # Warm the derived cookie parameters so requests pay a single dict lookup
+    settings.cookie_kwargs
+    settings.logout_cookie_kwargs
+    return settings
 
 settings = get_settings()
@@ -1,20 +1,18 @@
+from dataclasses import dataclass
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, ConfigDict
-from ..models.user import UserInDB
 from ..config import Settings
 
-class AppContext(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AppContext:
     """
     Application context that holds request-level data.
     This includes the current authenticated user and application settings.
+    A frozen slotted dataclass so per-request construction is a cheap
+    attribute assignment rather than a Pydantic validation pass, and the
+    context stays read-only for the lifetime of the request.
     """
-    user: Optional[UserInDB] = None
     settings: Settings
-
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-        from_attributes=True
-    )
+    user: Optional[Dict[str, Any]] = None
 
     @property
     def is_authenticated(self) -> bool:
@@ -24,4 +22,4 @@ class AppContext(BaseModel):
     @property
     def is_admin(self) -> bool:
         """Check if the current user is an admin"""
-        return self.is_authenticated and self.user.role == "admin" 
\ No newline at end of file
+        return self.is_authenticated and self.user.get("role") == "admin"
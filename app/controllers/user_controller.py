@@ -1,206 +1,140 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends
+from starlette.status import HTTP_201_CREATED
+from fastapi.responses import ORJSONResponse
 
 from ..models.user import User, UserCreate, UserUpdate
-from ..services.user_service import UserService
-from ..core.exceptions import NotFoundError, ValidationError, DatabaseError
-from ..dependencies import get_user_service, get_app_context
-from ..context.app_context import AppContext
+from ..dependencies import UserDeps, get_user_deps, require_auth
 
 router = APIRouter(
     tags=["Users"],
-    prefix="/users"
+    prefix="/users",
+    default_response_class=ORJSONResponse
 )
 
-@router.post("/", response_model=User, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=User, status_code=HTTP_201_CREATED)
 async def create_user(
     user_data: UserCreate,
-    ctx: AppContext = Depends(get_app_context),
-    user_service: UserService = Depends(get_user_service)
-) -> User:
+    deps: UserDeps = Depends(get_user_deps)
+) -> ORJSONResponse:
     """
     Create a new user
-    
+
     Args:
         user_data (UserCreate): User data including email, full name, and password
-        ctx (AppContext): Application context
-        
+        deps (UserDeps): Bundled application context and user service
+
     Returns:
         User: Created user information
-        
+
     Raises:
         HTTPException: If email is already registered
     """
-    try:
-        return await user_service.create_user(user_data)
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    user = await deps.service.create_user(user_data)
+    return ORJSONResponse(user.model_dump(mode="json"), status_code=HTTP_201_CREATED)
 
 @router.get("/{user_id}", response_model=User)
 async def get_user(
     user_id: str,
-    ctx: AppContext = Depends(get_app_context),
-    user_service: UserService = Depends(get_user_service)
-) -> User:
+    deps: UserDeps = Depends(get_user_deps)
+) -> ORJSONResponse:
     """
     Get user by ID
-    
+
     Args:
         user_id (str): User's unique identifier
-        ctx (AppContext): Application context
-        
+        deps (UserDeps): Bundled application context and user service
+
     Returns:
         User: User information
-        
+
     Raises:
         HTTPException: If user is not found
     """
-    try:
-        return await user_service.get_user(user_id)
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    user = await deps.service.get_user(user_id)
+    return ORJSONResponse(user.model_dump(mode="json"))
 
 @router.put("/{user_id}", response_model=User)
 async def update_user(
     user_id: str,
     user_data: UserUpdate,
-    ctx: AppContext = Depends(get_app_context),
-    user_service: UserService = Depends(get_user_service)
-) -> User:
+    deps: UserDeps = Depends(get_user_deps)
+) -> ORJSONResponse:
     """
     Update user information
-    
+
     Args:
         user_id (str): User's unique identifier
         user_data (UserUpdate): Fields to update
-        ctx (AppContext): Application context
-        
+        deps (UserDeps): Bundled application context and user service
+
     Returns:
         User: Updated user information
-        
+
     Raises:
         HTTPException: If user is not found or update data is invalid
     """
-    try:
-        return await user_service.update_user(user_id, user_data)
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    user = await deps.service.update_user(user_id, user_data)
+    return ORJSONResponse(user.model_dump(mode="json"))
 
 @router.post("/{user_id}/verify-email", response_model=User)
 async def verify_email(
     user_id: str,
-    ctx: AppContext = Depends(get_app_context),
-    user_service: UserService = Depends(get_user_service)
-) -> User:
+    deps: UserDeps = Depends(get_user_deps)
+) -> ORJSONResponse:
     """
     Mark user's email as verified
-    
+
     Args:
         user_id (str): User's unique identifier
-        ctx (AppContext): Application context
-        
+        deps (UserDeps): Bundled application context and user service
+
     Returns:
         User: Updated user information
-        
+
     Raises:
         HTTPException: If user is not found
     """
-    try:
-        return await user_service.verify_email(user_id)
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    user = await deps.service.verify_email(user_id)
+    return ORJSONResponse(user.model_dump(mode="json"))
 
 @router.put("/{user_id}/preferences", response_model=User)
 async def update_preferences(
     user_id: str,
     preferences: dict,
-    ctx: AppContext = Depends(get_app_context),
-    user_service: UserService = Depends(get_user_service)
-) -> User:
+    deps: UserDeps = Depends(get_user_deps)
+) -> ORJSONResponse:
     """
     Update user preferences
-    
+
     Args:
         user_id (str): User's unique identifier
         preferences (Dict): New preferences
-        ctx (AppContext): Application context
-        
+        deps (UserDeps): Bundled application context and user service
+
     Returns:
         User: Updated user information
-        
+
     Raises:
         HTTPException: If user is not found
     """
-    try:
-        return await user_service.update_preferences(user_id, preferences)
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
-
-@router.get("/me", response_model=User)
+    user = await deps.service.update_preferences(user_id, preferences)
+    return ORJSONResponse(user.model_dump(mode="json"))
+
+@router.get("/me")
 async def get_current_user_info(
-    ctx: AppContext = Depends(get_app_context)
-) -> User:
+    user: dict = Depends(require_auth)
+) -> dict:
     """
     Get current user information
-    
+
     Args:
-        ctx (AppContext): Application context containing current user
-        
+        user (dict): Current authenticated user
+
     Returns:
-        User: Current user information
-        
+        dict: Current user information
+
     Raises:
-        HTTPException: If user is not found
+        HTTPException: If the request is not authenticated
     """
-    if not ctx.is_authenticated:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated"
-        )
-    return ctx.user 
\ No newline at end of file
+    return user
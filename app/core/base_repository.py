@@ -1,27 +1,27 @@
-from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
 T = TypeVar('T')
 
-class BaseRepository(ABC, Generic[T]):
-    """Base repository class that all repositories should inherit from"""
-    
-    @abstractmethod
+class BaseRepository(Generic[T]):
+    """Base repository class that all repositories should inherit from.
+
+    A plain generic base rather than an ABC: the class is only used as a
+    typing bound, and skipping ABCMeta avoids its metaclass overhead on
+    subclass construction.
+    """
+
     async def create(self, entity: T) -> T:
         """Create a new entity"""
-        pass
-    
-    @abstractmethod
+        raise NotImplementedError
+
     async def get(self, id: str) -> T:
         """Get an entity by ID"""
-        pass
-    
-    @abstractmethod
+        raise NotImplementedError
+
     async def update(self, id: str, entity: T) -> T:
         """Update an entity"""
-        pass
-    
-    @abstractmethod
+        raise NotImplementedError
+
     async def delete(self, id: str) -> bool:
         """Delete an entity"""
-        pass 
\ No newline at end of file
+        raise NotImplementedError
@@ -2,18 +2,26 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from ..config import settings
 
 class Database:
-    client: AsyncIOMotorClient = None
-    db = None
+    __slots__ = ("client", "db")
+
+    def __init__(self):
+        self.client: AsyncIOMotorClient = None
+        self.db = None
 
 db = Database()
 
-async def get_database() -> AsyncIOMotorClient:
+def get_database():
     return db.db
 
 async def connect_to_mongo():
-    db.client = AsyncIOMotorClient(settings.MONGODB_URL)
+    db.client = AsyncIOMotorClient(
+        settings.MONGODB_URL,
+        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        serverSelectionTimeoutMS=3000
+    )
     db.db = db.client[settings.MONGODB_DB_NAME]
 
 async def close_mongo_connection():
     if db.client:
-        db.client.close() 
\ No newline at end of file
+        db.client.close()
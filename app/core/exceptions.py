@@ -1,24 +1,28 @@
 from fastapi import HTTPException, status
 
+# Shared bearer challenge headers — only ever read by FastAPI's response
+# encoder, so a single dict can serve every raise
+_BEARER_HEADERS = {"WWW-Authenticate": "Bearer"}
+
 class DatabaseError(HTTPException):
     def __init__(self, detail: str):
         super().__init__(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Database error: {detail}"
+            detail="Database error: %s" % detail
         )
 
 class NotFoundError(HTTPException):
     def __init__(self, resource: str, id: str):
         super().__init__(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{resource} with id {id} not found"
+            detail="%s with id %s not found" % (resource, id)
         )
 
 class ValidationError(HTTPException):
     def __init__(self, detail: str):
         super().__init__(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Validation error: {detail}"
+            detail="Validation error: %s" % detail
         )
 
 class AuthenticationError(HTTPException):
@@ -26,5 +30,5 @@ class AuthenticationError(HTTPException):
         super().__init__(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=detail,
-            headers={"WWW-Authenticate": "Bearer"}
-        ) 
\ No newline at end of file
+            headers=_BEARER_HEADERS
+        )
@@ -0,0 +1,63 @@
+import time
+
+class ProcessTimeMiddleware:
+    """
+    Pure ASGI middleware that stamps X-Process-Time on every response.
+
+    Implemented at the ASGI level rather than via @app.middleware("http")
+    because Starlette's BaseHTTPMiddleware adds a task group and an extra
+    coroutine hop per request; this class is a single send wrapper.
+    """
+
+    __slots__ = ("app",)
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                elapsed = (time.perf_counter_ns() - start_ns) * 1e-9
+                headers = message.setdefault("headers", [])
+                headers.append((b"x-process-time", format(elapsed, ".6f").encode()))
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
+
+# Canned liveness response, rendered once. Probes only care about the 200.
+_HEALTH_BODY = b'{"status":"healthy"}'
+_HEALTH_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_HEALTH_BODY)).encode()),
+    ],
+}
+
+class HealthCheckMiddleware:
+    """
+    Answer load-balancer liveness probes on /health before the rest of the
+    middleware stack (CORS, trusted host, timing) or the router runs.
+
+    The detailed diagnostic endpoint lives at /health/full and goes through
+    the application as usual.
+    """
+
+    __slots__ = ("app",)
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/health":
+            await send(_HEALTH_START)
+            await send({"type": "http.response.body", "body": _HEALTH_BODY})
+            return
+        await self.app(scope, receive, send)
@@ -1,85 +1,222 @@
-from datetime import datetime, timedelta
+import asyncio
+import base64
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+import bcrypt
+import jwt
+import orjson
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hmac as chmac
 from passlib.context import CryptContext
-from ..context.app_context import AppContext
 
 from ..config import settings
-from ..services.user_service import UserService
+from .database import get_database
+from ..repositories.user_repository import UserRepository
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes go through the bcrypt package directly: its Rust backend runs
+# the Blowfish key schedule natively with no passlib glue per call. The
+# passlib context stays only to verify hashes minted by earlier builds
+# (argon2 or passlib-formatted bcrypt).
+_BCRYPT_ROUNDS = settings.BCRYPT_COST
+
+# blake2b keys are capped at 64 bytes
+_PEPPER_KEY = (settings.PEPPER or settings.SECRET_KEY).encode()[:64]
+
+def _pepper(password: str) -> bytes:
+    """
+    Keyed BLAKE2b pre-hash applied before bcrypt. Gives bcrypt a constant
+    32-byte input (sidestepping its 72-byte truncation), and a leaked hash
+    table cannot be attacked offline without the server-side key.
+    """
+    return hashlib.blake2b(password.encode(), key=_PEPPER_KEY, digest_size=32).digest()
+
+PWD_CONTEXT = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=3,
+    argon2__memory_cost=65536,
+    argon2__parallelism=4,
+    bcrypt__rounds=settings.BCRYPT_COST,
+    bcrypt__ident="2b"
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Single signing/verification key bound once at import so token paths do
+# not re-read settings (or worse, disagree on the key) per call
+_JWT_KEY = settings.SECRET_KEY
+
+# The JOSE header is fixed for this service, so its base64url form is a
+# constant: {"alg":"HS256","typ":"JWT"}
+_JWT_HEADER_B64 = b"eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
+
+# HMAC object with the key schedule (inner/outer pads) already absorbed;
+# copying it per token skips re-deriving the pads from the key each call.
+# The cryptography primitive goes through OpenSSL's EVP interface, which
+# picks up SHA-NI hardware rounds where the CPU has them.
+_HMAC_PROTO = chmac.HMAC(_JWT_KEY.encode(), hashes.SHA256())
+
+def _b64url(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+# Successful token validations keyed by a digest of the raw token (the token
+# itself is never stored). Entries carry the JWT exp claim so an expired
+# token is never served from cache; only successful validations are cached.
+_jwt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+def verify_password_detailed(plain_password: str, hashed_password: str) -> tuple:
+    """
+    Verify a password and report, from the same pass, whether its hash
+    should be re-minted. The branch that matched already determines the
+    verdict a separate needs-update check would re-derive with a second
+    full bcrypt: a peppered hash only needs re-minting when its embedded
+    cost is below the configured target, while a raw (un-peppered) bcrypt
+    hash or a legacy passlib scheme always does.
+
+    Args:
+        plain_password (str): Plain text password
+        hashed_password (str): Hashed password
+
+    Returns:
+        tuple: (matched, needs_update); needs_update is only meaningful
+            when matched is True
+    """
+    # $2a/$2b hashes (the modular-crypt bcrypt family) verify natively;
+    # anything else falls back to the passlib context
+    if hashed_password.startswith("$2"):
+        if bcrypt.checkpw(_pepper(plain_password), hashed_password.encode()):
+            try:
+                return True, int(hashed_password[4:6]) < settings.BCRYPT_COST
+            except ValueError:
+                return True, True
+        # Hashes minted before peppering landed took the raw password
+        if bcrypt.checkpw(plain_password.encode(), hashed_password.encode()):
+            return True, True
+        return False, False
+    matched = PWD_CONTEXT.verify(plain_password, hashed_password)
+    return matched, matched
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return verify_password_detailed(plain_password, hashed_password)[0]
 
 def get_password_hash(password: str) -> str:
     """Generate password hash"""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(_pepper(password), bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)).decode()
+
+# bcrypt releases the GIL while it runs the key schedule, so a thread pool
+# gives real parallelism across cores without the process-spawn and pickle
+# overhead of a ProcessPoolExecutor. Bounded to the core count: more workers
+# than cores just queue CPU-bound work.
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
 
-def create_access_token(data: dict, secret_key: str, expires_delta: Optional[timedelta] = None) -> str:
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the bcrypt pool, keeping the event loop free"""
+    return await asyncio.get_running_loop().run_in_executor(
+        _BCRYPT_POOL, verify_password, plain_password, hashed_password
+    )
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the bcrypt pool, keeping the event loop free"""
+    return await asyncio.get_running_loop().run_in_executor(
+        _BCRYPT_POOL, get_password_hash, password
+    )
+
+async def verify_password_detailed_async(plain_password: str, hashed_password: str) -> tuple:
+    """Run verify_password_detailed on the bcrypt pool"""
+    return await asyncio.get_running_loop().run_in_executor(
+        _BCRYPT_POOL, verify_password_detailed, plain_password, hashed_password
+    )
+
+def create_access_token(data: dict, secret_key: str = _JWT_KEY, expires_at: Optional[int] = None) -> str:
     """
     Create a new access token
-    
+
     Args:
         data (dict): Token payload data
         secret_key (str): Secret key for token signing
-        expires_delta (Optional[timedelta]): Token expiration time
-        
+        expires_at (Optional[int]): Expiry as an epoch second; defaults to
+            15 minutes from now
+
     Returns:
         str: JWT access token
     """
+    # Claims only need the integer epoch, so no datetime objects are built
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+    to_encode["exp"] = expires_at if expires_at is not None else int(time.time()) + 900
+    payload_b64 = _b64url(orjson.dumps(to_encode, option=orjson.OPT_SORT_KEYS))
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
+    if secret_key is _JWT_KEY:
+        sig = _HMAC_PROTO.copy()
     else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, secret_key, algorithm="HS256")
+        sig = chmac.HMAC(secret_key.encode(), hashes.SHA256())
+    sig.update(signing_input)
+    return (signing_input + b"." + _b64url(sig.finalize())).decode()
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict:
     """
     Dependency for getting the current authenticated user.
-    
+    Validated tokens are cached so repeat requests with the same bearer
+    token skip both the signature check and the database lookup.
+
     Args:
         token (str): JWT token from OAuth2PasswordBearer
-        
+
     Returns:
         Dict: User information
-        
+
     Raises:
         HTTPException: If token is invalid or user not found
     """
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _jwt_cache.get(cache_key)
+    if cached is not None:
+        user_dict, exp = cached
+        if exp > time.time():
+            return user_dict
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
     try:
         # Decode JWT token
         payload = jwt.decode(
             token,
-            "your-secret-key",
-            algorithms=["HS256"]
+            _JWT_KEY,
+            algorithms=["HS256"],
+            options={"require": ["exp", "sub"]}
         )
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+    except jwt.PyJWTError:
         raise credentials_exception
-    
-    # Get user from database
-    user_service = UserService()
-    user = await user_service.get_user(user_id)
-    if user is None:
+
+    # Get user from database; the auth projection fetches only the three
+    # fields the request context needs
+    user_repository = UserRepository(get_database())
+    user = await user_repository.get_by_id_for_auth(user_id)
+    if user is None or not user.get("is_active", True):
         raise credentials_exception
-    
-    return {
-        "id": str(user.id),
-        "email": user.email,
-        "role": user.role
-    } 
\ No newline at end of file
+
+    user_dict = {
+        "id": str(user["_id"]),
+        "email": user["email"],
+        "role": user["role"]
+    }
+
+    # The dependency runs on a single event loop and there is no await
+    # between the lookup and this insert, so no lock is needed
+    exp = payload.get("exp")
+    if exp:
+        _jwt_cache[cache_key] = (user_dict, exp)
+
+    return user_dict
@@ -1,131 +1,176 @@
-from typing import Annotated, AsyncGenerator
-from fastapi import Depends
+from collections import namedtuple
+from typing import Annotated, Any, Dict
+from fastapi import Depends, Request
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from .core.database import get_database
 from .config import Settings, get_settings
+from .core.exceptions import AuthenticationError
 from .core.security import get_current_user
 from .repositories import UserRepository, TopicRepository
 from .services import UserService, AuthService, TopicService
 from .context.app_context import AppContext
 
 # Database dependency
-async def get_db() -> AsyncGenerator[AsyncIOMotorDatabase, None]:
+async def get_db() -> AsyncIOMotorDatabase:
     """
-    Get database connection
-    
+    Get database connection. Motor's client is already a connection pool,
+    so there is nothing to clean up per request — a plain return avoids
+    the generator-dependency overhead.
+
     Returns:
-        AsyncGenerator[AsyncIOMotorDatabase, None]: Database connection
+        AsyncIOMotorDatabase: Database connection
     """
-    db = await get_database()
-    try:
-        yield db
-    finally:
-        # Connection is managed by the database module
-        pass
+    return get_database()
 
-# Repository dependencies
-async def get_user_repository(db: AsyncIOMotorDatabase = Depends(get_db)) -> UserRepository:
+# Repository and service dependencies. The instances are singletons bound
+# to app.state at startup, so resolution is a single attribute read rather
+# than rebuilding the object graph per request.
+async def get_user_repository(request: Request) -> UserRepository:
     """
-    Get UserRepository instance
-    
+    Get the shared UserRepository instance
+
     Args:
-        db (AsyncIOMotorDatabase): Database connection
-        
+        request (Request): Current request
+
     Returns:
         UserRepository: UserRepository instance
     """
-    return UserRepository(db)
+    return request.app.state.user_repository
 
-async def get_topic_repository(db: AsyncIOMotorDatabase = Depends(get_db)) -> TopicRepository:
+async def get_topic_repository(request: Request) -> TopicRepository:
     """
-    Get TopicRepository instance
-    
+    Get the shared TopicRepository instance
+
     Args:
-        db (AsyncIOMotorDatabase): Database connection
-        
+        request (Request): Current request
+
     Returns:
         TopicRepository: TopicRepository instance
     """
-    return TopicRepository(db)
+    return request.app.state.topic_repository
 
-# Service dependencies
-async def get_user_service(
-    user_repository: UserRepository = Depends(get_user_repository)
-) -> UserService:
+async def get_user_service(request: Request) -> UserService:
     """
-    Get UserService instance
-    
+    Get the shared UserService instance
+
     Args:
-        user_repository (UserRepository): UserRepository instance
-        
+        request (Request): Current request
+
     Returns:
         UserService: UserService instance
     """
-    return UserService(user_repository)
+    return request.app.state.user_service
 
-async def get_topic_service(
-    topic_repository: TopicRepository = Depends(get_topic_repository)
-) -> TopicService:
+async def get_topic_service(request: Request) -> TopicService:
     """
-    Get TopicService instance
-    
+    Get the shared TopicService instance
+
     Args:
-        topic_repository (TopicRepository): TopicRepository instance
-        
+        request (Request): Current request
+
     Returns:
         TopicService: TopicService instance
     """
-    return TopicService(topic_repository)
+    return request.app.state.topic_service
 
-async def get_auth_service(
-    user_repository: UserRepository = Depends(get_user_repository)
-) -> AuthService:
+async def get_auth_service(request: Request) -> AuthService:
     """
-    Get AuthService instance
-    
+    Get the shared AuthService instance
+
     Args:
-        user_repository (UserRepository): UserRepository instance
-        
+        request (Request): Current request
+
     Returns:
         AuthService: AuthService instance
     """
-    return AuthService(user_repository)
+    return request.app.state.auth_service
 
-async def get_app_config_context(
-    settings: Settings = Depends(get_settings)
-) -> AsyncGenerator[AppContext, None]:
+# Settings are process-wide, so a single anonymous context serves every
+# request that carries no user.
+_ANON_CTX = AppContext(settings=get_settings())
+
+async def get_app_config_context() -> AppContext:
     """
     Get application configuration context.
     This includes only the application settings, without user context.
-    
-    Args:
-        settings (Settings): Application settings from get_settings
-        
+
     Returns:
-        AppConfigContext: Application configuration context
+        AppContext: Shared application configuration context
     """
-    context = AppContext(settings=settings.model_dump())
-
-    yield context 
+    return _ANON_CTX
 
 async def get_app_context(
     user: dict = Depends(get_current_user),
     settings: Settings = Depends(get_settings)
-) -> AsyncGenerator[AppContext, None]:
+) -> AppContext:
     """
     Get application context for the current request.
     This includes the current user and application settings.
-    
+
     Args:
         user (dict): Current authenticated user from get_current_user
         settings (Settings): Application settings from get_settings
-        
+
     Returns:
         AppContext: Application context instance
     """
-    context = AppContext(
-        user=user,
-        settings=settings.model_dump()
-    )
-    yield context 
\ No newline at end of file
+    return AppContext(user=user, settings=settings)
+
+async def require_auth(
+    ctx: AppContext = Depends(get_app_context)
+) -> Dict[str, Any]:
+    """
+    Require an authenticated user for the current request.
+    Resolved once per request by FastAPI's dependency cache, so handlers
+    no longer repeat the is_authenticated check inline.
+
+    Args:
+        ctx (AppContext): Application context
+
+    Returns:
+        Dict[str, Any]: The authenticated user
+
+    Raises:
+        AuthenticationError: If the request carries no authenticated user
+    """
+    if ctx.user is None:
+        raise AuthenticationError("Not authenticated")
+    return ctx.user
+
+# Aggregated per-resource dependencies: one cache lookup and one call in
+# FastAPI's resolver instead of one per handler parameter
+TopicDeps = namedtuple("TopicDeps", ["user", "service"])
+UserDeps = namedtuple("UserDeps", ["ctx", "service"])
+
+async def get_topic_deps(
+    user: Dict[str, Any] = Depends(require_auth),
+    service: TopicService = Depends(get_topic_service)
+) -> TopicDeps:
+    """
+    Get the bundled dependencies for topic endpoints
+
+    Args:
+        user (Dict[str, Any]): Current authenticated user
+        service (TopicService): TopicService instance
+
+    Returns:
+        TopicDeps: Authenticated user and topic service
+    """
+    return TopicDeps(user, service)
+
+async def get_user_deps(
+    ctx: AppContext = Depends(get_app_context),
+    service: UserService = Depends(get_user_service)
+) -> UserDeps:
+    """
+    Get the bundled dependencies for user endpoints
+
+    Args:
+        ctx (AppContext): Application context
+        service (UserService): UserService instance
+
+    Returns:
+        UserDeps: Application context and user service
+    """
+    return UserDeps(ctx, service) 
\ No newline at end of file
@@ -1,24 +1,98 @@
+import sys
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+import asyncio
 import logging
 import time
+
+import orjson
+import structlog
+from contextlib import asynccontextmanager
 from typing import List
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
 
 from .config import settings
-from .core.database import connect_to_mongo, close_mongo_connection
+from .core.database import connect_to_mongo, close_mongo_connection, db
+from .core.middleware import HealthCheckMiddleware, ProcessTimeMiddleware
 from .controllers import auth_router, user_router, topic_router
+from .repositories import UserRepository, TopicRepository
+from .services import UserService, AuthService, TopicService
 
 # Configure logging
 logging.basicConfig(
     level=settings.LOG_LEVEL.upper(),
     format=settings.LOG_FORMAT
 )
+
+# structlog pipeline, compiled once at import: service loggers emit JSON
+# lines through orjson with no %-format work per call
+structlog.configure(
+    processors=[
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.JSONRenderer(serializer=lambda obj, **kwargs: orjson.dumps(obj).decode()),
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(
+        getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
+    ),
+    cache_logger_on_first_use=True,
+)
+
 logger = logging.getLogger(__name__)
 
+# Swap the default event loop for uvloop where it is available (Linux/macOS).
+# Installing here covers programmatic runs; the uvicorn CMDs pass the loop
+# and http flags explicitly for the container entry points.
+if sys.platform != "win32":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:  # pragma: no cover - optional speedup
+        pass
+
+# Application lifespan: replaces the deprecated startup/shutdown event
+# handlers and lets the independent parts of startup overlap
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Connecting to MongoDB...")
+    await connect_to_mongo()
+
+    # Once the client exists, the warm-up ping and the index declarations
+    # are independent round trips; run them concurrently. create_index is
+    # idempotent so this is safe on every startup.
+    await asyncio.gather(
+        db.db.command("ping"),
+        db.db.users.create_index("email", unique=True),
+        db.db.topics.create_index("user_id"),
+        db.db.topics.create_index([("user_id", 1), ("updated_at", -1)]),
+    )
+    logger.info("Connected to MongoDB successfully")
+
+    # Bind singleton repositories and services to app.state so request
+    # dependencies resolve with a single attribute read instead of
+    # rebuilding the object graph per request
+    user_repository = UserRepository(db.db)
+    topic_repository = TopicRepository(db.db)
+    app.state.user_repository = user_repository
+    app.state.topic_repository = topic_repository
+    app.state.user_service = UserService(user_repository)
+    app.state.topic_service = TopicService(topic_repository)
+    app.state.auth_service = AuthService(user_repository)
+
+    # Build the OpenAPI schema now so the first /docs consumer is served
+    # from the cache on app.openapi_schema
+    app.openapi()
+
+    yield
+
+    logger.info("Closing MongoDB connection...")
+    await close_mongo_connection()
+    logger.info("MongoDB connection closed")
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -27,7 +101,9 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=None,  # Disable default docs
     redoc_url=None,  # Disable default redoc
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add trusted host middleware in production
@@ -46,27 +122,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add request timing middleware
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
-
-# Database connection events
-@app.on_event("startup")
-async def startup_db_client():
-    logger.info("Connecting to MongoDB...")
-    await connect_to_mongo()
-    logger.info("Connected to MongoDB successfully")
+# Add request timing middleware (pure ASGI, monotonic clock)
+app.add_middleware(ProcessTimeMiddleware)
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    logger.info("Closing MongoDB connection...")
-    await close_mongo_connection()
-    logger.info("MongoDB connection closed")
+# Added last so it runs first: liveness probes never touch the stack below
+app.add_middleware(HealthCheckMiddleware)
 
 # Root endpoint
 @app.get("/")
@@ -77,8 +137,9 @@ async def root():
         "environment": settings.ENVIRONMENT.value
     }
 
-# Health check endpoint
-@app.get("/health")
+# Detailed health check; the bare /health liveness probe is answered by
+# HealthCheckMiddleware before the app is reached
+@app.get("/health/full")
 async def health_check():
     return {
         "status": "healthy",
@@ -91,24 +152,29 @@ app.include_router(auth_router, prefix=settings.API_V1_STR)
 app.include_router(user_router, prefix=settings.API_V1_STR)
 app.include_router(topic_router, prefix=settings.API_V1_STR)
 
-# Custom documentation endpoints
+# Custom documentation endpoints. The inputs are static, so the HTML is
+# rendered once at import and each hit is a plain bytes response.
+_SWAGGER_HTML = get_swagger_ui_html(
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    title=f"{settings.PROJECT_NAME} - Swagger UI",
+    oauth2_redirect_url=app.swagger_ui_oauth2_redirect_url,
+    swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5.9.0/swagger-ui-bundle.js",
+    swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5.9.0/swagger-ui.css",
+).body
+
+_REDOC_HTML = get_redoc_html(
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    title=f"{settings.PROJECT_NAME} - ReDoc",
+    redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js",
+).body
+
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui_html():
-    return get_swagger_ui_html(
-        openapi_url=f"{settings.API_V1_STR}/openapi.json",
-        title=f"{settings.PROJECT_NAME} - Swagger UI",
-        oauth2_redirect_url=app.swagger_ui_oauth2_redirect_url,
-        swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5.9.0/swagger-ui-bundle.js",
-        swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5.9.0/swagger-ui.css",
-    )
+    return HTMLResponse(_SWAGGER_HTML)
 
 @app.get("/redoc", include_in_schema=False)
 async def redoc_html():
-    return get_redoc_html(
-        openapi_url=f"{settings.API_V1_STR}/openapi.json",
-        title=f"{settings.PROJECT_NAME} - ReDoc",
-        redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js",
-    )
+    return HTMLResponse(_REDOC_HTML)
 
 # Custom OpenAPI schema
 def custom_openapi():
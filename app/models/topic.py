@@ -1,6 +1,7 @@
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from .user import PyObjectId
 
 class TopicBase(BaseModel):
@@ -16,12 +17,17 @@ class TopicInDB(TopicBase):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        json_encoders = {
-            PyObjectId: str,
-            datetime: lambda dt: dt.isoformat()
-        }
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
+
+    @cached_property
+    def id_str(self) -> str:
+        """String form of the document id, hex-encoded once per instance"""
+        return str(self.id)
+
+    @cached_property
+    def user_id_str(self) -> str:
+        """String form of the owning user id, hex-encoded once per instance"""
+        return str(self.user_id)
 
 class Topic(TopicInDB):
     pass
@@ -1,10 +1,20 @@
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, EmailStr, Field, validator, StringConstraints, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, field_validator, StringConstraints, ConfigDict
 from bson import ObjectId
 import re
 from pydantic_core import CoreSchema, core_schema
 
+# Validator patterns compiled once at import; the inline re.match/re.search
+# calls were recompiling (or at least re-hashing into the regex cache) on
+# every validated field
+_PHONE_RE = re.compile(r'^\+?1?\d{9,15}$')
+_UPPER = re.compile(r'[A-Z]')
+_LOWER = re.compile(r'[a-z]')
+_DIGIT = re.compile(r'\d')
+_SPECIAL = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
 class PyObjectId(str):
     """Custom type for MongoDB ObjectId"""
     @classmethod
@@ -34,15 +44,17 @@ class UserBase(BaseModel):
     phone_number: Optional[str] = Field(None, min_length=10, max_length=15, description="User's phone number")
     role: str = Field(default="user", description="User's role in the system", pattern="^(user|admin)$")
 
-    @validator('phone_number')
+    @field_validator('phone_number')
+    @classmethod
     def validate_phone_number(cls, v):
         if v is not None:
             # Basic phone number validation (can be customized based on requirements)
-            if not re.match(r'^\+?1?\d{9,15}$', v):
+            if not _PHONE_RE.match(v):
                 raise ValueError('Invalid phone number format')
         return v
 
-    @validator('role')
+    @field_validator('role')
+    @classmethod
     def validate_role(cls, v):
         allowed_roles = ['user', 'admin']
         if v not in allowed_roles:
@@ -54,27 +66,33 @@ class UserCreate(UserBase):
     password: str = Field(..., min_length=8, description="User's password")
     confirm_password: str = Field(..., description="Password confirmation")
 
-    @validator('confirm_password')
-    def passwords_match(cls, v, values, **kwargs):
-        if 'password' in values and v != values['password']:
+    @field_validator('confirm_password')
+    @classmethod
+    def passwords_match(cls, v, info):
+        if 'password' in info.data and v != info.data['password']:
             raise ValueError('Passwords do not match')
         return v
 
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def password_strength(cls, v):
         """Validate password strength"""
-        if not re.search(r'[A-Z]', v):
+        if not _UPPER.search(v):
             raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
+        if not _LOWER.search(v):
             raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
+        if not _DIGIT.search(v):
             raise ValueError('Password must contain at least one number')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
+        if not _SPECIAL.search(v):
             raise ValueError('Password must contain at least one special character')
         return v
 
 class UserInDB(UserBase):
     """Model for user data in database"""
+    # Documents coming back from Mongo already passed EmailStr at ingress;
+    # re-running email-validator (regex + IDNA) per read buys nothing. The
+    # schema format is kept for the docs.
+    email: str = Field(..., description="User's email address", json_schema_extra={"format": "email"})
     id: Optional[PyObjectId] = Field(default=None, alias="_id")
     hashed_password: str = Field(..., description="Hashed password")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Account creation timestamp")
@@ -84,13 +102,12 @@ class UserInDB(UserBase):
     is_email_verified: bool = Field(default=False, description="Whether email is verified")
     preferences: Dict = Field(default_factory=dict, description="User preferences")
 
-    model_config = ConfigDict(
-        json_encoders={
-            PyObjectId: str,
-            datetime: lambda dt: dt.isoformat()
-        },
-        populate_by_name=True
-    )
+    model_config = ConfigDict(populate_by_name=True)
+
+    @cached_property
+    def id_str(self) -> str:
+        """String form of the document id, hex-encoded once per instance"""
+        return str(self.id)
 
 class User(UserInDB):
     """Model for user API responses"""
@@ -100,11 +117,7 @@ class User(UserInDB):
     last_login: Optional[datetime] = Field(None, description="Last login timestamp")
     is_email_verified: bool = Field(..., description="Whether email is verified")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 class UserUpdate(BaseModel):
     """Model for user updates"""
@@ -115,17 +128,19 @@ class UserUpdate(BaseModel):
     is_active: Optional[bool] = None
     preferences: Optional[Dict] = None
 
-    @validator('phone_number')
+    @field_validator('phone_number')
+    @classmethod
     def validate_phone_number(cls, v):
         if v is not None:
-            if not re.match(r'^\+?1?\d{9,15}$', v):
+            if not _PHONE_RE.match(v):
                 raise ValueError('Invalid phone number format')
         return v
 
-    @validator('role')
+    @field_validator('role')
+    @classmethod
     def validate_role(cls, v):
         if v is not None:
             allowed_roles = ['user', 'admin']
             if v not in allowed_roles:
                 raise ValueError(f'Role must be one of {allowed_roles}')
-        return v 
\ No newline at end of file
+        return v
@@ -1,44 +1,65 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
 
 from ..models.topic import TopicCreate, TopicInDB, TopicUpdate
 
+def _hydrate(doc: dict) -> TopicInDB:
+    # Documents coming back from our own collection were validated on the
+    # way in; model_construct skips re-running every field validator
+    doc["id"] = doc.pop("_id")
+    return TopicInDB.model_construct(**doc)
+
 class TopicRepository:
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
-        self.collection_name = "topics"
+        # Cached handle: one attribute read per query instead of a
+        # __getitem__ lookup on the database for every call
+        self.collection = db.topics
 
     async def create(self, topic: TopicCreate, user_id: str) -> TopicInDB:
         topic_dict = topic.model_dump()
         topic_dict["user_id"] = ObjectId(user_id)
-        topic_dict["created_at"] = datetime.utcnow()
-        topic_dict["updated_at"] = datetime.utcnow()
+        now = datetime.now(timezone.utc)
+        topic_dict["created_at"] = now
+        topic_dict["updated_at"] = now
         
-        result = await self.db[self.collection_name].insert_one(topic_dict)
-        created_topic = await self.db[self.collection_name].find_one({"_id": result.inserted_id})
-        return TopicInDB(**created_topic)
+        # The document was fully built locally; merge the generated _id in
+        # instead of re-reading it from the server, and hydrate without
+        # validation — the raw ObjectId values would fail the str schema
+        result = await self.collection.insert_one(topic_dict)
+        topic_dict["_id"] = result.inserted_id
+        return _hydrate(topic_dict)
 
     async def get_by_id(self, topic_id: str) -> Optional[TopicInDB]:
-        topic = await self.db[self.collection_name].find_one({"_id": ObjectId(topic_id)})
-        return TopicInDB(**topic) if topic else None
+        topic = await self.collection.find_one({"_id": ObjectId(topic_id)})
+        return _hydrate(topic) if topic else None
 
     async def get_all_for_user(self, user_id: str) -> List[TopicInDB]:
-        cursor = self.db[self.collection_name].find({"user_id": ObjectId(user_id)})
-        topics = await cursor.to_list(length=None)
-        return [TopicInDB(**topic) for topic in topics]
+        # A fixed batch size keeps each network read bounded; to_list(None)
+        # let the server pick batches and buffered without a cap
+        cursor = self.collection.find({"user_id": ObjectId(user_id)}).batch_size(200)
+        return [_hydrate(topic) async for topic in cursor]
 
     async def update(self, topic_id: str, topic_update: TopicUpdate) -> Optional[TopicInDB]:
+        # Parse the hex id once; both branches below reuse it
+        oid = ObjectId(topic_id)
         update_data = topic_update.model_dump(exclude_unset=True)
-        if update_data:
-            update_data["updated_at"] = datetime.utcnow()
-            await self.db[self.collection_name].update_one(
-                {"_id": ObjectId(topic_id)},
-                {"$set": update_data}
-            )
-        return await self.get_by_id(topic_id)
+        if not update_data:
+            topic = await self.collection.find_one({"_id": oid})
+            return _hydrate(topic) if topic else None
+        update_data["updated_at"] = datetime.now(timezone.utc)
+        topic = await self.collection.find_one_and_update(
+            {"_id": oid},
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
+        )
+        return _hydrate(topic) if topic else None
 
     async def delete(self, topic_id: str) -> bool:
-        result = await self.db[self.collection_name].delete_one({"_id": ObjectId(topic_id)})
-        return result.deleted_count > 0 
\ No newline at end of file
+        # find_one_and_delete reports whether anything matched in the same
+        # round trip, so callers need no separate existence check
+        topic = await self.collection.find_one_and_delete({"_id": ObjectId(topic_id)})
+        return topic is not None 
\ No newline at end of file
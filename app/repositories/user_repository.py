@@ -1,11 +1,14 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
 from ..models.user import UserCreate, UserInDB, UserUpdate
-from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def _hydrate(doc: dict) -> UserInDB:
+    """Build a UserInDB from a trusted Mongo document without re-validating"""
+    doc["id"] = doc.pop("_id")
+    return UserInDB.model_construct(**doc)
 
 class UserRepository:
     def __init__(self, db: AsyncIOMotorDatabase):
@@ -16,13 +19,15 @@ class UserRepository:
             db (AsyncIOMotorDatabase): MongoDB database connection
         """
         self.db = db
-        self.collection_name = "users"
+        # Cached handle: one attribute read per query instead of a
+        # __getitem__ lookup on the database for every call
+        self.collection = db.users
 
     async def get_by_email(self, email: str) -> Optional[UserInDB]:
         """Get user by email address"""
-        user = await self.db[self.collection_name].find_one({"email": email})
+        user = await self.collection.find_one({"email": email})
         if user:
-            return UserInDB(**user)
+            return _hydrate(user)
         return None
 
     async def create(self, user_data: UserInDB) -> UserInDB:
@@ -35,78 +40,103 @@ class UserRepository:
         Returns:
             UserInDB: Created user
         """
-        user_dict = user_data.model_dump(exclude={'id'}, by_alias=True)
-        result = await self.db[self.collection_name].insert_one(user_dict)
-        user_dict["_id"] = str(result.inserted_id)
-        return UserInDB(**user_dict)
+        # __dict__ holds the already-validated field values, so copying it
+        # skips the full serialization walk that model_dump performs
+        user_dict = dict(user_data.__dict__)
+        user_dict.pop("id", None)
+        user_dict.pop("id_str", None)  # cached_property, present once read
+        result = await self.collection.insert_one(user_dict)
+        user_dict["_id"] = result.inserted_id
+        return _hydrate(user_dict)
 
     async def get_by_id(self, user_id: str) -> Optional[UserInDB]:
         """Get user by ID"""
-        user = await self.db[self.collection_name].find_one({"_id": ObjectId(user_id)})
+        user = await self.collection.find_one({"_id": ObjectId(user_id)})
         if user:
-            return UserInDB(**user)
+            return _hydrate(user)
         return None
 
+    async def get_by_id_for_auth(self, user_id: str) -> Optional[Dict]:
+        """
+        Get the minimal identity fields needed to authenticate a request.
+        The projection keeps the hashed password, preferences and other
+        heavyweight fields off the wire, and the raw dict skips model
+        validation entirely.
+
+        Args:
+            user_id (str): User's ID
+
+        Returns:
+            Optional[Dict]: Projected user document, or None if not found
+        """
+        return await self.collection.find_one(
+            {"_id": ObjectId(user_id)},
+            {"_id": 1, "email": 1, "role": 1, "is_active": 1}
+        )
+
     async def update(self, user_id: str, update_data: Dict) -> Optional[UserInDB]:
         """Update user information"""
-        update_data["updated_at"] = datetime.utcnow()
-        
-        result = await self.db[self.collection_name].update_one(
+        update_data["updated_at"] = datetime.now(timezone.utc)
+
+        user = await self.collection.find_one_and_update(
             {"_id": ObjectId(user_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
         )
-        if result.modified_count:
-            return await self.get_by_id(user_id)
-        return None
+        return _hydrate(user) if user else None
 
     async def update_login_info(self, user_id: str, success: bool = True) -> Optional[UserInDB]:
         """Update user's login information"""
-        update_data = {
-            "updated_at": datetime.utcnow()
-        }
-        
+        # One snapshot per call: updated_at and last_login land on the same
+        # instant instead of three separate clock reads
+        now = datetime.now(timezone.utc)
         if success:
-            update_data.update({
-                "last_login": datetime.utcnow(),
-                "failed_login_attempts": 0
-            })
+            update_op = {
+                "$set": {
+                    "updated_at": now,
+                    "last_login": now,
+                    "failed_login_attempts": 0
+                }
+            }
         else:
-            update_data["$inc"] = {"failed_login_attempts": 1}
-        
-        result = await self.db[self.collection_name].update_one(
+            # Operators must not be mixed with plain keys; the old code put
+            # $inc inside the $set document, so the counter never moved
+            update_op = {
+                "$set": {"updated_at": now},
+                "$inc": {"failed_login_attempts": 1}
+            }
+
+        user = await self.collection.find_one_and_update(
             {"_id": ObjectId(user_id)},
-            {"$set": update_data} if success else update_data
+            update_op,
+            return_document=ReturnDocument.AFTER
         )
-        if result.modified_count:
-            return await self.get_by_id(user_id)
-        return None
+        return _hydrate(user) if user else None
 
     async def verify_email(self, user_id: str) -> Optional[UserInDB]:
         """Mark user's email as verified"""
-        result = await self.db[self.collection_name].update_one(
+        user = await self.collection.find_one_and_update(
             {"_id": ObjectId(user_id)},
             {
                 "$set": {
                     "is_email_verified": True,
-                    "updated_at": datetime.utcnow()
+                    "updated_at": datetime.now(timezone.utc)
                 }
-            }
+            },
+            return_document=ReturnDocument.AFTER
         )
-        if result.modified_count:
-            return await self.get_by_id(user_id)
-        return None
+        return _hydrate(user) if user else None
 
     async def update_preferences(self, user_id: str, preferences: Dict) -> Optional[UserInDB]:
         """Update user preferences"""
-        result = await self.db[self.collection_name].update_one(
+        user = await self.collection.find_one_and_update(
             {"_id": ObjectId(user_id)},
             {
                 "$set": {
                     "preferences": preferences,
-                    "updated_at": datetime.utcnow()
+                    "updated_at": datetime.now(timezone.utc)
                 }
-            }
+            },
+            return_document=ReturnDocument.AFTER
         )
-        if result.modified_count:
-            return await self.get_by_id(user_id)
-        return None 
\ No newline at end of file
+        return _hydrate(user) if user else None 
\ No newline at end of file
@@ -1,21 +1,34 @@
-from datetime import datetime, timedelta
-from typing import Optional
-import logging
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import hashlib
+import time
+from datetime import datetime
 
+import structlog
+from cachetools import TTLCache
+from pymongo.errors import DuplicateKeyError
+
+from ..config import settings
 from ..models.user import User, UserCreate, UserInDB
 from ..repositories import UserRepository
-from ..core.security import verify_password, get_password_hash, create_access_token
+from ..core.security import verify_password_async, verify_password_detailed_async, hash_password_async, create_access_token, get_password_hash
 from ..core.exceptions import AuthenticationError, ValidationError, DatabaseError
 from ..context.app_context import AppContext
 
-logger = logging.getLogger(__name__)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = structlog.get_logger(__name__).bind(service="auth")
 
 class AuthService:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
+        # Verified against when the email is unknown, so a failed login costs
+        # one bcrypt round trip whether or not the account exists; otherwise
+        # response latency leaks which emails are registered
+        self._dummy_hash = get_password_hash("invalid-password")
+        # Recently verified credentials: (email, keyed password digest) ->
+        # stored hash. A short TTL turns retry storms and refresh-style
+        # polling into cache hits instead of repeat bcrypt runs; only
+        # successful verifications are ever inserted.
+        self._verify_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+        # blake2b keys are capped at 64 bytes
+        self._verify_key = settings.SECRET_KEY.encode()[:64]
 
     async def register_user(self, user_data: UserCreate, ctx: AppContext) -> User:
         """
@@ -33,22 +46,24 @@ class AuthService:
             DatabaseError: If database operation fails
         """
         try:
-            # Check if email already exists
-            existing_user = await self.user_repository.get_by_email(user_data.email)
-            if existing_user:
-                raise ValidationError("Email already registered")
-
-            # Create new user
-            hashed_password = get_password_hash(user_data.password)
-            user_in_db = UserInDB(
+            # Create new user; hashing is CPU-bound, keep it off the event
+            # loop. The uniqueness pre-check used to be an I/O call worth
+            # overlapping with the hash, but it is gone (the unique index
+            # rejects duplicates on insert) and the insert itself needs the
+            # hash, so registration is strictly hash-then-insert now.
+            hashed_password = await hash_password_async(user_data.password)
+            now = datetime.utcnow()
+            # Every field below is either validated client input or built
+            # here, so skip a second validation pass
+            user_in_db = UserInDB.model_construct(
                 full_name=user_data.full_name,
                 email=user_data.email,
                 hashed_password=hashed_password,
                 phone_number=user_data.phone_number,
                 is_active=True,
                 is_email_verified=False,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
                 failed_login_attempts=0,
                 preferences={}
             )
@@ -57,7 +72,9 @@ class AuthService:
             user_model = User(**created_user.model_dump())
             return user_model
 
-        except ValidationError: 
+        except DuplicateKeyError:
+            raise ValidationError("Email already registered")
+        except ValidationError:
             raise
         except Exception as e:
             raise DatabaseError(f"Failed to register user: {str(e)}")
@@ -80,21 +97,49 @@ class AuthService:
         """
         try:
             user = await self.user_repository.get_by_email(email)
-            if not user:
-                raise AuthenticationError("Invalid email or password")
 
-            if not verify_password(password, user["password"]):
+            needs_update = False
+            if user is not None:
+                digest = hashlib.blake2b(
+                    password.encode(), key=self._verify_key, digest_size=16
+                ).digest()
+                cache_key = (email, digest)
+                # A hit only counts while the stored hash is unchanged, so a
+                # password rotation invalidates the entry naturally
+                ok_pw = self._verify_cache.get(cache_key) == user.hashed_password
+                if not ok_pw:
+                    # The detailed verify reports the rehash verdict from the
+                    # same bcrypt pass; a cache hit means the miss that filled
+                    # the entry already acted on it
+                    ok_pw, needs_update = await verify_password_detailed_async(
+                        password, user.hashed_password
+                    )
+                    if ok_pw:
+                        self._verify_cache[cache_key] = user.hashed_password
+            else:
+                # Dummy verify keeps unknown-email timing aligned with the
+                # wrong-password path
+                ok_pw = await verify_password_async(password, self._dummy_hash)
+
+            ok_user = user is not None and user.is_active
+            if not (ok_pw & ok_user):
+                if user is not None and ok_pw and not user.is_active:
+                    raise AuthenticationError("User account is inactive")
                 raise AuthenticationError("Invalid email or password")
 
-            if not user.get("is_active", False):
-                raise AuthenticationError("User account is inactive")
+            # We hold the plaintext only here, so this is the one chance to
+            # migrate under-cost or legacy hashes without a password reset.
+            # Re-minting changes the stored hash, which invalidates the
+            # cache entry inserted above.
+            if needs_update:
+                await self._rehash(user, password)
 
-            # Create access token
-            access_token_expires = timedelta(minutes=ctx.settings["ACCESS_TOKEN_EXPIRE_MINUTES"])
+            logger.info("auth.login", user_id=user.id_str)
+
+            # Create access token; the expiry is plain integer epoch math
             access_token = create_access_token(
-                data={"sub": str(user["_id"])},
-                secret_key=ctx.settings["SECRET_KEY"],
-                expires_delta=access_token_expires
+                data={"sub": user.id_str},
+                expires_at=int(time.time()) + ctx.settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
             )
 
             return access_token
@@ -104,6 +149,18 @@ class AuthService:
         except Exception as e:
             raise DatabaseError(f"Authentication failed: {str(e)}")
 
+    async def _rehash(self, user: UserInDB, password: str) -> None:
+        """
+        Persist a freshly minted hash for a login whose verify reported the
+        stored one as under-cost, un-peppered or legacy
+
+        Args:
+            user (UserInDB): Authenticated user
+            password (str): Verified plaintext password
+        """
+        new_hash = await hash_password_async(password)
+        await self.user_repository.update(user.id_str, {"hashed_password": new_hash})
+
     async def refresh_token(self, user_id: str, ctx: AppContext) -> str:
         """
         Refresh access token for a user
@@ -120,23 +177,15 @@ class AuthService:
             DatabaseError: If database operation fails
         """
         try:
-            user = await self.user_repository.get_by_id(user_id)
-            if not user:
-                raise AuthenticationError("User not found")
-
-            if not user.get("is_active", False):
-                raise AuthenticationError("User account is inactive")
-
-            # Create new access token
-            access_token_expires = timedelta(minutes=ctx.settings["ACCESS_TOKEN_EXPIRE_MINUTES"])
-            access_token = create_access_token(
-                data={"sub": str(user["_id"])},
-                secret_key=ctx.settings["SECRET_KEY"],
-                expires_delta=access_token_expires
+            # The caller only reaches this point through the auth dependency,
+            # which has already validated the token and checked is_active on
+            # the projected user document — re-fetching the user here would
+            # duplicate that round trip, so refresh is pure signing
+            return create_access_token(
+                data={"sub": user_id},
+                expires_at=int(time.time()) + ctx.settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
             )
 
-            return access_token
-
         except AuthenticationError:
             raise
         except Exception as e:
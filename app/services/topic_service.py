@@ -3,6 +3,27 @@ from ..models.topic import TopicCreate, TopicInDB, TopicUpdate, Topic
 from ..repositories import TopicRepository
 from ..core.exceptions import NotFoundError, ValidationError, DatabaseError
 
+def _build_topic_converter():
+    """
+    Generate the TopicInDB -> Topic conversion function from the model's
+    field set; see _build_user_converter in user_service for the rationale
+
+    Returns:
+        Callable: Specialized conversion function
+    """
+    # The two ObjectId fields read their cached hex strings
+    aliases = {"id": "u.id_str", "user_id": "u.user_id_str"}
+    parts = [
+        f"{name}={aliases.get(name, 'u.' + name)}"
+        for name in Topic.model_fields
+    ]
+    source = "def _fast(u):\n    return Topic.model_construct(%s)" % ", ".join(parts)
+    namespace = {"Topic": Topic}
+    exec(source, namespace)
+    return namespace["_fast"]
+
+_fast_convert_topic = _build_topic_converter()
+
 class TopicService:
     def __init__(self, repository: TopicRepository):
         self.repository = repository
@@ -88,15 +109,11 @@ class TopicService:
             DatabaseError: If database operation fails
         """
         try:
-            # Check if topic exists
-            existing_topic = await self.repository.get_by_id(topic_id)
-            if not existing_topic:
-                raise NotFoundError("Topic", topic_id)
-
-            # Update topic
+            # The update itself reports whether the topic existed, so no
+            # separate pre-fetch round trip is needed
             updated_topic = await self.repository.update(topic_id, topic_update)
             if not updated_topic:
-                raise ValidationError("Failed to update topic")
+                raise NotFoundError("Topic", topic_id)
 
             return self._convert_to_topic_model(updated_topic)
         except (NotFoundError, ValidationError):
@@ -116,14 +133,9 @@ class TopicService:
             DatabaseError: If database operation fails
         """
         try:
-            # Check if topic exists
-            existing_topic = await self.repository.get_by_id(topic_id)
-            if not existing_topic:
-                raise NotFoundError("Topic", topic_id)
-
-            # Delete topic
+            # One round trip: the delete reports whether the topic existed
             if not await self.repository.delete(topic_id):
-                raise DatabaseError("Failed to delete topic")
+                raise NotFoundError("Topic", topic_id)
         except NotFoundError:
             raise
         except Exception as e:
@@ -139,11 +151,4 @@ class TopicService:
         Returns:
             Topic: API response topic model
         """
-        return Topic(
-            id=str(topic_in_db.id),
-            title=topic_in_db.title,
-            description=topic_in_db.description,
-            user_id=str(topic_in_db.user_id),
-            created_at=topic_in_db.created_at,
-            updated_at=topic_in_db.updated_at
-        ) 
\ No newline at end of file
+        return _fast_convert_topic(topic_in_db)
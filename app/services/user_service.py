@@ -1,17 +1,48 @@
 from typing import Optional, Dict
 from datetime import datetime
-import logging
+
+import structlog
+from cachetools import TTLCache
 from ..models.user import User, UserCreate, UserInDB, UserUpdate
 from ..repositories import UserRepository
-from passlib.context import CryptContext
+from pymongo.errors import DuplicateKeyError
+from ..core.security import hash_password_async, verify_password_async
 from ..core.exceptions import NotFoundError, ValidationError, DatabaseError
 
-logger = logging.getLogger(__name__)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = structlog.get_logger(__name__).bind(service="users")
+
+def _build_user_converter():
+    """
+    Generate the UserInDB -> User conversion function from the model's own
+    field set, so the converter and the model can never drift apart. The
+    generated body is a single model_construct call with plain attribute
+    reads — no per-call dict building or field iteration.
+
+    Returns:
+        Callable: Specialized conversion function
+    """
+    # The hash and internal bookkeeping fields never leave the service
+    # layer; id reads the hex string cached on the instance
+    excluded = {"hashed_password", "failed_login_attempts", "preferences"}
+    parts = [
+        "id=u.id_str" if name == "id" else f"{name}=u.{name}"
+        for name in User.model_fields
+        if name not in excluded
+    ]
+    source = "def _fast(u):\n    return User.model_construct(%s)" % ", ".join(parts)
+    namespace = {"User": User}
+    exec(source, namespace)
+    return namespace["_fast"]
+
+_fast_convert_user = _build_user_converter()
 
 class UserService:
     def __init__(self, repository: UserRepository):
         self.repository = repository
+        # Recently read users by id. The short TTL bounds staleness for
+        # writes that bypass this service; every mutating method below
+        # pops its entry so same-process updates are never stale.
+        self._user_cache: TTLCache = TTLCache(maxsize=50_000, ttl=30)
 
     async def create_user(self, user_data: UserCreate) -> User:
         """
@@ -28,19 +59,32 @@ class UserService:
             DatabaseError: If database operation fails
         """
         try:
-            # Validate password strength
-            user_data.validate_password_strength()
-            
-            # Check if email already exists
-            existing_user = await self.repository.get_by_email(user_data.email)
-            if existing_user:
-                raise ValidationError("Email already registered")
-            
-            # Create user in database
-            user_in_db = await self.repository.create(user_data)
-            
+            # Password strength is enforced by UserCreate's field validators
+            # at request parsing; duplicate emails are rejected by the unique
+            # index on insert, so no pre-check round trip is needed. Hash off
+            # the event loop and persist a proper UserInDB — the raw
+            # UserCreate still carries the plaintext password and its
+            # confirmation, which must never reach the collection.
+            hashed_password = await hash_password_async(user_data.password)
+            now = datetime.utcnow()
+            user_in_db = UserInDB.model_construct(
+                full_name=user_data.full_name,
+                email=user_data.email,
+                hashed_password=hashed_password,
+                phone_number=user_data.phone_number,
+                is_active=True,
+                is_email_verified=False,
+                created_at=now,
+                updated_at=now,
+                failed_login_attempts=0,
+                preferences={}
+            )
+            created_user = await self.repository.create(user_in_db)
+
             # Convert to response model
-            return self._convert_to_user_model(user_in_db)
+            return self._convert_to_user_model(created_user)
+        except DuplicateKeyError:
+            raise ValidationError("Email already registered")
         except ValidationError:
             raise
         except Exception as e:
@@ -61,9 +105,12 @@ class UserService:
             DatabaseError: If database operation fails
         """
         try:
-            user_in_db = await self.repository.get_by_id(user_id)
-            if not user_in_db:
-                raise NotFoundError("User", user_id)
+            user_in_db = self._user_cache.get(user_id)
+            if user_in_db is None:
+                user_in_db = await self.repository.get_by_id(user_id)
+                if not user_in_db:
+                    raise NotFoundError("User", user_id)
+                self._user_cache[user_id] = user_in_db
 
             return self._convert_to_user_model(user_in_db)
         except NotFoundError:
@@ -88,23 +135,22 @@ class UserService:
             DatabaseError: If database operation fails
         """
         try:
-            # Check if user exists
-            existing_user = await self.repository.get_by_id(user_id)
-            if not existing_user:
-                raise NotFoundError("User", user_id)
-
-            # If email is being updated, check if it's already taken
-            if update_data.email and update_data.email != existing_user.email:
-                existing_user_by_email = await self.repository.get_by_email(update_data.email)
-                if existing_user_by_email:
-                    raise ValidationError("Email already registered")
-
-            # Update user
-            updated_user = await self.repository.update(user_id, update_data.dict(exclude_unset=True))
+            # One round trip: the unique index rejects an email owned by
+            # another account, and the update reports whether the user
+            # existed. Read the explicitly-set fields straight off __dict__ rather
+            # than through the (deprecated) .dict() serialization pass
+            update_fields = {
+                k: v for k, v in update_data.__dict__.items()
+                if k in update_data.model_fields_set
+            }
+            updated_user = await self.repository.update(user_id, update_fields)
             if not updated_user:
-                raise ValidationError("Failed to update user")
+                raise NotFoundError("User", user_id)
 
+            self._user_cache.pop(user_id, None)
             return self._convert_to_user_model(updated_user)
+        except DuplicateKeyError:
+            raise ValidationError("Email already registered")
         except (NotFoundError, ValidationError):
             raise
         except Exception as e:
@@ -121,7 +167,7 @@ class UserService:
         Returns:
             bool: True if password matches, False otherwise
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        return await verify_password_async(plain_password, hashed_password)
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """
@@ -161,11 +207,12 @@ class UserService:
             DatabaseError: If database operation fails
         """
         try:
-            user_in_db = await self.repository.get_by_id(user_id)
+            user_in_db = await self.repository.update_login_info(user_id, success)
             if not user_in_db:
                 raise NotFoundError("User", user_id)
-            
-            return await self.repository.update_login_info(user_id, success)
+
+            self._user_cache.pop(user_id, None)
+            return self._convert_to_user_model(user_in_db)
         except NotFoundError:
             raise
         except Exception as e:
@@ -186,11 +233,12 @@ class UserService:
             DatabaseError: If database operation fails
         """
         try:
-            user_in_db = await self.repository.get_by_id(user_id)
+            user_in_db = await self.repository.verify_email(user_id)
             if not user_in_db:
                 raise NotFoundError("User", user_id)
-            
-            return await self.repository.verify_email(user_id)
+
+            self._user_cache.pop(user_id, None)
+            return self._convert_to_user_model(user_in_db)
         except NotFoundError:
             raise
         except Exception as e:
@@ -212,11 +260,12 @@ class UserService:
             DatabaseError: If database operation fails
         """
         try:
-            user_in_db = await self.repository.get_by_id(user_id)
+            user_in_db = await self.repository.update_preferences(user_id, preferences)
             if not user_in_db:
                 raise NotFoundError("User", user_id)
-            
-            return await self.repository.update_preferences(user_id, preferences)
+
+            self._user_cache.pop(user_id, None)
+            return self._convert_to_user_model(user_in_db)
         except NotFoundError:
             raise
         except Exception as e:
@@ -232,15 +281,4 @@ class UserService:
         Returns:
             User: API response user model
         """
-        return User(
-            id=str(user_in_db.id),
-            email=user_in_db.email,
-            full_name=user_in_db.full_name,
-            is_active=user_in_db.is_active,
-            phone_number=user_in_db.phone_number,
-            role=user_in_db.role,
-            created_at=user_in_db.created_at,
-            updated_at=user_in_db.updated_at,
-            last_login=user_in_db.last_login,
-            is_email_verified=user_in_db.is_email_verified
-        ) 
\ No newline at end of file
+        return _fast_convert_user(user_in_db)